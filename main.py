@@ -2,44 +2,291 @@ import os
 import shutil
 import uuid
 import argparse
+import asyncio
+import functools
+import pickle
 import platform
+import threading
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+try:
+    # 可选依赖：Windows走CopyFile2、Linux对CIFS挂载走服务端COPYCHUNK，
+    # 网络盘上的备份可跳过用户态read/write循环
+    import speedcopy
+    speedcopy.patch_copyfile()
+except ImportError:
+    speedcopy = None
+
+# 操作系统在进程生命周期内不变，模块级取一次即可
+_SYSTEM = platform.system()
+
+try:
+    # 可选依赖：C级序列化器，比stdlib json快数倍且直接产出bytes
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _atomic_write_json(path, obj):
+    """把对象序列化为JSON并原子性写入
+
+    先写临时文件、fsync后以os.replace换入，读取方永远只会看到
+    完整文件——这使读侧可以放心用mtime做缓存失效，不怕半截写入。
+
+    Args:
+        path: 目标文件路径
+        obj: 可JSON序列化的对象
+    """
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _dumps(obj))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+# 各系统的基础路径模板，路径完全由操作系统决定，无需每次构造时重新分支
+_PATHS_BY_SYSTEM = {
+    "Darwin": {
+        "extension_path": "~/.vscode/extensions/augment.vscode-augment-0.509.1",
+        "config_path": "~/Library/Application Support/Code/User/globalStorage/augment.vscode-augment",
+        "workspace_storage": "~/Library/Application Support/Code/User/workspaceStorage",
+    },
+    "Windows": {
+        "extension_path": "~\\.vscode\\extensions\\augment.vscode-augment-0.509.1",
+        "config_path": "~\\AppData\\Roaming\\Code\\User\\globalStorage\\augment.vscode-augment",
+        "workspace_storage": "~\\AppData\\Roaming\\Code\\User\\workspaceStorage",
+    },
+    "Linux": {
+        "extension_path": "~/.vscode/extensions/augment.vscode-augment-0.509.1",
+        "config_path": "~/.config/Code/User/globalStorage/augment.vscode-augment",
+        "workspace_storage": "~/.config/Code/User/workspaceStorage",
+    },
+}
+
+
+@functools.cache
+def _get_augment_paths(system):
+    """按操作系统返回展开后的AugmentCode相关路径
+
+    结果只依赖操作系统，缓存后重复构造管理器不再重新展开路径。
+
+    Args:
+        system: platform.system()的返回值
+    """
+    templates = _PATHS_BY_SYSTEM.get(system, _PATHS_BY_SYSTEM["Linux"])
+    return {name: os.path.expanduser(path) for name, path in templates.items()}
+
+
+def _link_or_copy(src, dst):
+    """备份单个文件：同文件系统用硬链接快照，否则回退到copy2
+
+    硬链接是O(1)且共享inode，零字节经过Python进程；跨设备（EXDEV）
+    或文件系统不支持硬链接时回退到完整复制。
+
+    Args:
+        src: 源文件
+        dst: 目标文件
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class MultithreadedCopier(ThreadPoolExecutor):
+    """把单文件复制提交到线程池，让备份的逐文件复制并发执行
+
+    复制在内核I/O期间释放GIL，小文件多的目录树可借此打满磁盘队列。
+    作为上下文管理器使用，退出时等待所有复制完成。
+    """
+
+    def __init__(self, max_workers=None, copy_function=shutil.copy2):
+        super().__init__(max_workers=max_workers)
+        self._copy_function = copy_function
+        self._futures = []
+
+    def copy(self, src, dst):
+        self._futures.append(self.submit(self._copy_function, src, dst))
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 等全部复制结束后逐一取result，让第一个复制异常传给调用方，
+        # 避免备份悄悄失败却被当作成功
+        super().__exit__(exc_type, exc_val, exc_tb)
+        for future in self._futures:
+            future.result()
+        return False
+
+
+def _load_json_pickle_cached(path):
+    """加载JSON文件，使用pickle侧车文件做磁盘级缓存
+
+    以 (文件大小, st_mtime_ns) 作为缓存键，热路径命中时直接
+    pickle.loads，完全跳过JSON解析；源文件变动后自动失效。
+
+    Args:
+        path: JSON文件路径
+    """
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    cache_path = path + ".pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, obj = pickle.load(f)
+        if cached_key == key:
+            return obj
+    except Exception:
+        # 损坏/异构的pickle可能抛出任意异常（TypeError、ImportError、
+        # 解包失败等），一律视为未命中，回退到JSON解析并重写侧车
+        pass
+
+    with open(path, "rb") as f:
+        obj = _loads(f.read())
+
+    try:
+        # 写临时文件后os.replace换入：不原地改写inode（备份用硬链接
+        # 共享inode，原地truncate会连带改掉快照），读侧也不会读到半截
+        tmp = cache_path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((key, obj), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # 缓存写入失败不影响正常加载
+
+    return obj
+
+
+@functools.lru_cache(maxsize=64)
+def _read_json_cached(path, mtime_ns):
+    """读取JSON文件，以 (路径, st_mtime_ns) 为键做进程内缓存
+
+    进程内热调用直接命中lru；首次读取则落到pickle侧车的磁盘级
+    缓存，跨进程也能跳过JSON解析。文件变动后键随mtime失效。
+
+    Args:
+        path: JSON文件路径
+        mtime_ns: 该文件的st_mtime_ns，仅用于缓存失效
+    """
+    return _load_json_pickle_cached(path)
+
+
+def _copyfileobj_readinto(fsrc, fdst, length=1024 * 1024):
+    """用1MiB缓冲区 + readinto复制文件对象
+
+    shutil默认的16KiB缓冲对大文件（如state数据库）太小，放大缓冲并
+    通过memoryview原地读入可摊薄syscall开销，避免每轮分配新bytes。
+
+    Args:
+        fsrc: 源文件对象（二进制，需支持readinto）
+        fdst: 目标文件对象（二进制）
+        length: 缓冲区大小；非正数按stdlib惯例视为"用默认值"
+    """
+    # 该函数会整体替换shutil.copyfileobj，stdlib允许length<=0
+    # （0表示默认缓冲、负数表示一次读完），不能让其变成零字节复制
+    if length <= 0:
+        length = 1024 * 1024
+    with memoryview(bytearray(length)) as mv:
+        while n := fsrc.readinto(mv):
+            if n < length:
+                fdst.write(mv[:n])
+            else:
+                fdst.write(mv)
+
+
+def _empty_dir_fast(path):
+    """清空目录：先rename移开，再后台线程删除
+
+    rename是单个syscall，重置立即返回O(1)；真正的逐文件unlink由
+    后台线程完成。线程非daemon，解释器退出前会等垃圾目录删干净。
+
+    Args:
+        path: 要清空的目录
+    """
+    trash = f"{path}.trash_{uuid.uuid4().hex}"
+    os.rename(path, trash)
+    os.makedirs(path, exist_ok=True)
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def _fast_copytree(src, dst, copy_function=shutil.copy2):
+    """基于os.scandir的目录递归复制
+
+    复用DirEntry自带的stat结果（is_dir/is_symlink不再额外发起
+    stat系统调用），相比逐项os.path.isdir的遍历显著减少syscall。
+
+    Args:
+        src: 源目录
+        dst: 目标目录
+        copy_function: 单文件复制函数，默认shutil.copy2
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), dst_path)
+            elif entry.is_dir(follow_symlinks=False):
+                _fast_copytree(entry.path, dst_path, copy_function)
+            else:
+                copy_function(entry.path, dst_path)
+    shutil.copystat(src, dst)
+    return dst
 
 class AugmentEnvManager:
     def __init__(self, verbose=False):
         """初始化AugmentCode环境管理器"""
         self.verbose = verbose
-        self.system = platform.system()
+        self.system = _SYSTEM
         
-        # 配置日志
-        logging.basicConfig(
-            level=logging.INFO if verbose else logging.WARNING,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # 配置日志（只在根logger尚未配置时生效，重复构造不叠加handler）
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO if verbose else logging.WARNING,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger('AugmentCodeManager')
+
+        # verbose模式下让speedcopy打印实际使用的复制路径：
+        # 旧版看模块属性SPEEDCOPY_DEBUG，新版走speedcopy logger
+        if speedcopy is not None and verbose:
+            speedcopy.SPEEDCOPY_DEBUG = True
+            logging.getLogger("speedcopy").setLevel(logging.DEBUG)
+
+        # Windows上没有sendfile快速路径，用大缓冲readinto兜底
+        if self.system == "Windows":
+            shutil.copyfileobj = _copyfileobj_readinto
         
-        # 根据系统设置路径
-        if self.system == "Darwin":  # macOS
-            self.extension_path = os.path.expanduser("~/.vscode/extensions/augment.vscode-augment-0.509.1")
-            self.config_path = os.path.expanduser("~/Library/Application Support/Code/User/globalStorage/augment.vscode-augment")
-            self.workspace_storage = os.path.expanduser("~/Library/Application Support/Code/User/workspaceStorage")
-        elif self.system == "Windows":
-            self.extension_path = os.path.expanduser("~\\.vscode\\extensions\\augment.vscode-augment-0.509.1")
-            self.config_path = os.path.expanduser("~\\AppData\\Roaming\\Code\\User\\globalStorage\\augment.vscode-augment")
-            self.workspace_storage = os.path.expanduser("~\\AppData\\Roaming\\Code\\User\\workspaceStorage")
-        else:  # Linux
-            self.extension_path = os.path.expanduser("~/.vscode/extensions/augment.vscode-augment-0.509.1")
-            self.config_path = os.path.expanduser("~/.config/Code/User/globalStorage/augment.vscode-augment")
-            self.workspace_storage = os.path.expanduser("~/.config/Code/User/workspaceStorage")
+        # 根据系统设置路径（模块级缓存，重复构造不再重新展开）
+        paths = _get_augment_paths(self.system)
+        self.extension_path = paths["extension_path"]
+        self.config_path = paths["config_path"]
+        self.workspace_storage = paths["workspace_storage"]
         
         # 关键文件和目录
         self.device_id_file = os.path.join(self.config_path, "deviceId.json")
         self.auth_file = os.path.join(self.config_path, "auth.json")
         self.history_dir = os.path.join(self.config_path, "history")
         self.cache_dir = os.path.join(self.config_path, "cache")
-        self.workspace_configs = os.path.join(self.workspace_storage, "*", "Augment.vscode-augment")
+        self.workspaces_dir = os.path.join(self.config_path, "workspaces")
         
         self.logger.info(f"AugmentCode管理器已初始化，系统: {self.system}")
         
@@ -57,7 +304,8 @@ class AugmentEnvManager:
         
         try:
             os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-            shutil.copytree(self.config_path, backup_path)
+            with MultithreadedCopier(max_workers=8, copy_function=_link_or_copy) as copier:
+                _fast_copytree(self.config_path, backup_path, copier.copy)
             self.logger.info(f"环境已备份至: {backup_path}")
             print(f"✅ 环境已备份至: {backup_path}")
             return backup_path
@@ -87,44 +335,23 @@ class AugmentEnvManager:
             print("⚠️ 未找到AugmentCode配置目录，可能未安装或路径不正确")
             return False
         
-        # 重置设备ID
+        # 各重置步骤操作互不相交的文件/目录，放入线程池并发执行，
+        # 总耗时趋近于最慢一步而非各步之和
+        steps = []
         if reset_all or reset_device_id:
-            if os.path.exists(self.device_id_file):
-                os.remove(self.device_id_file)
-                self.logger.info("已重置设备ID")
-                print("✅ 已重置设备ID")
-            else:
-                self.logger.info("设备ID文件不存在，跳过")
-        
-        # 重置认证状态
+            steps.append(self._reset_device_id)
         if reset_all or reset_auth:
-            if os.path.exists(self.auth_file):
-                os.remove(self.auth_file)
-                self.logger.info("已重置认证状态")
-                print("✅ 已重置认证状态")
-            else:
-                self.logger.info("认证文件不存在，跳过")
-        
-        # 清理历史记录
+            steps.append(self._reset_auth)
         if reset_all or reset_history:
-            if os.path.exists(self.history_dir):
-                shutil.rmtree(self.history_dir)
-                os.makedirs(self.history_dir, exist_ok=True)
-                self.logger.info("已清理历史记录")
-                print("✅ 已清理历史记录")
-            else:
-                self.logger.info("历史记录目录不存在，跳过")
-        
-        # 清理缓存
+            steps.append(self._reset_history)
         if reset_all or reset_cache:
-            if os.path.exists(self.cache_dir):
-                shutil.rmtree(self.cache_dir)
-                os.makedirs(self.cache_dir, exist_ok=True)
-                self.logger.info("已清理缓存")
-                print("✅ 已清理缓存")
-            else:
-                self.logger.info("缓存目录不存在，跳过")
-        
+            steps.append(self._reset_cache)
+
+        async def _run_steps():
+            await asyncio.gather(*(asyncio.to_thread(step) for step in steps))
+
+        asyncio.run(_run_steps())
+
         # 清理工作区特定配置
         if reset_all:
             for workspace_config in self._find_workspace_configs():
@@ -137,11 +364,55 @@ class AugmentEnvManager:
         
         print("🎉 环境重置完成！请重启VS Code并重新登录AugmentCode。")
         return True
-    
+
+    def _reset_device_id(self):
+        """重置设备ID"""
+        if os.path.exists(self.device_id_file):
+            os.remove(self.device_id_file)
+            self.logger.info("已重置设备ID")
+            print("✅ 已重置设备ID")
+        else:
+            self.logger.info("设备ID文件不存在，跳过")
+
+    def _reset_auth(self):
+        """重置认证状态"""
+        if os.path.exists(self.auth_file):
+            os.remove(self.auth_file)
+            self.logger.info("已重置认证状态")
+            print("✅ 已重置认证状态")
+        else:
+            self.logger.info("认证文件不存在，跳过")
+
+    def _reset_history(self):
+        """清理历史记录"""
+        if os.path.exists(self.history_dir):
+            _empty_dir_fast(self.history_dir)
+            self.logger.info("已清理历史记录")
+            print("✅ 已清理历史记录")
+        else:
+            self.logger.info("历史记录目录不存在，跳过")
+
+    def _reset_cache(self):
+        """清理缓存"""
+        if os.path.exists(self.cache_dir):
+            _empty_dir_fast(self.cache_dir)
+            self.logger.info("已清理缓存")
+            print("✅ 已清理缓存")
+        else:
+            self.logger.info("缓存目录不存在，跳过")
+
     def _find_workspace_configs(self):
-        """查找所有工作区特定的AugmentCode配置"""
-        import glob
-        return glob.glob(self.workspace_configs)
+        """查找所有工作区特定的AugmentCode配置
+
+        Path.glob内部走scandir，不会每次重编译模式；结果排序保证
+        顺序确定。不做缓存：匹配发生在workspaceStorage下一层，
+        父目录mtime感知不到其变化，没有可靠的失效键。
+        """
+        if not os.path.isdir(self.workspace_storage):
+            return []
+        return sorted(
+            str(p) for p in Path(self.workspace_storage).glob("*/Augment.vscode-augment")
+        )
     
     def create_workspace(self, name):
         """创建新的工作空间
@@ -149,7 +420,7 @@ class AugmentEnvManager:
         Args:
             name: 工作空间名称
         """
-        workspace_dir = os.path.join(self.config_path, "workspaces", name)
+        workspace_dir = os.path.join(self.workspaces_dir, name)
         
         if os.path.exists(workspace_dir):
             self.logger.error(f"工作空间 '{name}' 已存在")
@@ -168,8 +439,7 @@ class AugmentEnvManager:
             }
             
             config_path = os.path.join(workspace_dir, "workspace_config.json")
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            _atomic_write_json(config_path, config)
             
             self.logger.info(f"创建工作空间 '{name}' 成功")
             print(f"✅ 工作空间 '{name}' 创建成功")
@@ -185,7 +455,7 @@ class AugmentEnvManager:
         Args:
             name: 工作空间名称
         """
-        workspace_dir = os.path.join(self.config_path, "workspaces", name)
+        workspace_dir = os.path.join(self.workspaces_dir, name)
         
         if not os.path.exists(workspace_dir):
             self.logger.error(f"工作空间 '{name}' 不存在")
@@ -196,10 +466,9 @@ class AugmentEnvManager:
             # 备份当前环境
             self.backup_env()
             
-            # 加载工作区配置
+            # 加载工作区配置（进程内 + 磁盘两级缓存）
             config_path = os.path.join(workspace_dir, "workspace_config.json")
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = _read_json_cached(config_path, os.stat(config_path).st_mtime_ns)
             
             # 应用工作区配置
             self._apply_workspace_config(config)
@@ -222,27 +491,29 @@ class AugmentEnvManager:
         # 应用设备ID
         if "device_id" in config:
             os.makedirs(os.path.dirname(self.device_id_file), exist_ok=True)
-            with open(self.device_id_file, "w") as f:
-                json.dump({"deviceId": config["device_id"]}, f)
+            _atomic_write_json(self.device_id_file, {"deviceId": config["device_id"]})
         
         # 可以添加其他配置项的应用逻辑
     
     def list_workspaces(self):
         """列出所有工作空间"""
-        workspaces_dir = os.path.join(self.config_path, "workspaces")
+        workspaces_dir = self.workspaces_dir
         
         if not os.path.exists(workspaces_dir):
             print("没有找到工作空间")
             return []
         
+        # scandir复用目录项自带的类型信息，每个工作区只需对配置文件
+        # 再stat一次；stat结果同时作为解析缓存的失效键
         workspaces = []
-        for item in os.listdir(workspaces_dir):
-            item_path = os.path.join(workspaces_dir, item)
-            if os.path.isdir(item_path) and os.path.exists(os.path.join(item_path, "workspace_config.json")):
+        with os.scandir(workspaces_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                config_path = os.path.join(entry.path, "workspace_config.json")
                 try:
-                    with open(os.path.join(item_path, "workspace_config.json"), "r") as f:
-                        config = json.load(f)
-                    workspaces.append(config)
+                    st = os.stat(config_path)
+                    workspaces.append(_read_json_cached(config_path, st.st_mtime_ns))
                 except:
                     pass
         
@@ -260,14 +531,16 @@ class AugmentEnvManager:
         
         return workspaces
 
-def main():
+@functools.cache
+def _build_parser():
+    """构建命令行解析器（模块级缓存，进程内重复调用main不再重建）"""
     parser = argparse.ArgumentParser(description="AugmentCode环境管理器")
     subparsers = parser.add_subparsers(dest="command", help="可用命令")
     parser.add_argument("-v", "--verbose", action="store_true", help="启用详细日志")
-    
+
     # 备份命令
     backup_parser = subparsers.add_parser("backup", help="备份当前环境")
-    
+
     # 重置命令
     reset_parser = subparsers.add_parser("reset", help="重置环境")
     reset_parser.add_argument("--all", action="store_true", help="重置所有组件（默认）")
@@ -275,18 +548,23 @@ def main():
     reset_parser.add_argument("--auth", action="store_true", help="仅重置认证状态")
     reset_parser.add_argument("--history", action="store_true", help="仅重置历史记录")
     reset_parser.add_argument("--cache", action="store_true", help="仅重置缓存")
-    
+
     # 创建工作空间命令
     create_ws_parser = subparsers.add_parser("create-workspace", help="创建新工作空间")
     create_ws_parser.add_argument("name", help="工作空间名称")
-    
+
     # 切换工作空间命令
     switch_ws_parser = subparsers.add_parser("switch-workspace", help="切换到指定工作空间")
     switch_ws_parser.add_argument("name", help="工作空间名称")
-    
+
     # 列出工作空间命令
     list_ws_parser = subparsers.add_parser("list-workspaces", help="列出所有工作空间")
-    
+
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
     
     # 初始化管理器